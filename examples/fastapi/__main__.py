@@ -0,0 +1,36 @@
+"""Run the Product Inventory API with multiple Uvicorn worker processes.
+
+A single Uvicorn process serves every request from one event loop on one CPU
+core.  This entry point starts ``2 × CPU cores + 1`` workers by default; set
+``WEB_CONCURRENCY`` (the variable Uvicorn's own CLI reads) to override it.
+
+Uvicorn selects uvloop and httptools automatically when they are installed,
+which ``uvicorn[standard]`` provides.
+
+Usage:
+    python -m examples.fastapi
+    WEB_CONCURRENCY=4 python -m examples.fastapi
+"""
+
+from __future__ import annotations
+
+import os
+
+try:
+    import uvicorn
+except ImportError as exc:
+    raise SystemExit(
+        "Uvicorn is required to run this example: pip install 'uvicorn[standard]'"
+    ) from exc
+
+
+def default_workers() -> int:
+    """Return ``2 × CPU cores + 1``, the usual starting point for worker count."""
+    return (os.cpu_count() or 1) * 2 + 1
+
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "examples.fastapi.app:app",
+        workers=int(os.environ.get("WEB_CONCURRENCY", default_workers())),
+    )
@@ -6,6 +6,7 @@ decorators.  FlowDoc discovers the business flow by analysing which
 
 Usage:
     uvicorn examples.fastapi.app:app --reload
+    python -m examples.fastapi  # multi-worker, see __main__.py
 
 Generate diagrams:
     flowdoc generate examples/fastapi/app.py --format png
@@ -14,7 +15,7 @@ Generate diagrams:
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 
 from flowdoc import step
 
@@ -35,7 +36,7 @@ app = FastAPI(
 # ── Models ──────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateProductRequest:
     """Request payload for creating a product."""
 
@@ -46,7 +47,7 @@ class CreateProductRequest:
     category: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UpdateProductRequest:
     """Request payload for updating a product."""
 
@@ -56,11 +57,29 @@ class UpdateProductRequest:
     category: str | None = None
 
 
+@dataclass(slots=True, frozen=True)
+class ProductResponse:
+    """Response body for endpoints that return a product."""
+
+    status: str
+    product: dict
+
+
+# Field names are resolved once; ``asdict`` deep-copies every value on each call,
+# which is wasted work for these flat request models.
+_CREATE_FIELDS = tuple(f.name for f in fields(CreateProductRequest))
+_UPDATE_FIELDS = tuple(f.name for f in fields(UpdateProductRequest))
+
+
+def _to_dict(request: object, names: tuple[str, ...]) -> dict:
+    return {name: getattr(request, name) for name in names}
+
+
 # ── Helper steps ────────────────────────────────────────────────────
 
 
 @step(name="Validate Product Data", description="Check required fields and value ranges")
-def validate_product_data(data: dict) -> dict:
+async def validate_product_data(data: dict) -> dict:
     errors: list[str] = []
     if not data.get("name"):
         errors.append("name is required")
@@ -72,47 +91,47 @@ def validate_product_data(data: dict) -> dict:
 
 
 @step(name="Check Duplicate SKU", description="Ensure SKU is unique in catalog")
-def check_duplicate_sku(sku: str) -> bool:
+async def check_duplicate_sku(sku: str) -> bool:
     # Placeholder — would query the database in production
     return False
 
 
 @step(name="Save Product", description="Persist new product to the database")
-def save_product(data: dict) -> dict:
-    return notify_catalog_update({"id": "prod_123", **data})
+async def save_product(data: dict) -> dict:
+    return await notify_catalog_update({"id": "prod_123", **data})
 
 
 @step(name="Notify Catalog Update", description="Publish event for downstream systems")
-def notify_catalog_update(product: dict) -> dict:
+async def notify_catalog_update(product: dict) -> dict:
     # Placeholder — would publish to an event bus in production
     return product
 
 
 @step(name="Lookup Product", description="Query database for a product by ID")
-def lookup_product(product_id: str) -> dict | None:
+async def lookup_product(product_id: str) -> dict | None:
     # Placeholder — would query the database in production
     return None
 
 
 @step(name="Apply Update", description="Merge changes and persist to database")
-def apply_update(product_id: str, updates: dict) -> dict:
-    return notify_catalog_update({"id": product_id, **updates})
+async def apply_update(product_id: str, updates: dict) -> dict:
+    return await notify_catalog_update({"id": product_id, **updates})
 
 
 @step(name="Check Order References", description="Look for active orders referencing this product")
-def check_order_references(product_id: str) -> bool:
+async def check_order_references(product_id: str) -> bool:
     # Placeholder — would query the orders table in production
     return False
 
 
 @step(name="Soft Delete", description="Mark product as inactive")
-def soft_delete(product_id: str) -> dict:
-    return notify_catalog_update({"id": product_id, "action": "deactivated"})
+async def soft_delete(product_id: str) -> dict:
+    return await notify_catalog_update({"id": product_id, "action": "deactivated"})
 
 
 @step(name="Hard Delete", description="Permanently remove product from database")
-def hard_delete(product_id: str) -> dict:
-    return notify_catalog_update({"id": product_id, "action": "deleted"})
+async def hard_delete(product_id: str) -> dict:
+    return await notify_catalog_update({"id": product_id, "action": "deleted"})
 
 
 # ── Endpoints ───────────────────────────────────────────────────────
@@ -120,42 +139,42 @@ def hard_delete(product_id: str) -> dict:
 
 @app.post("/products", status_code=201)
 @step(name="Create Product", description="Validate, de-duplicate, and persist a new product")
-async def create_product(request: CreateProductRequest) -> dict:
-    result = validate_product_data(asdict(request))
+async def create_product(request: CreateProductRequest) -> ProductResponse:
+    result = await validate_product_data(_to_dict(request, _CREATE_FIELDS))
     if not result["valid"]:
         raise HTTPException(status_code=422, detail=result["errors"])
 
-    is_duplicate = check_duplicate_sku(request.sku)
+    is_duplicate = await check_duplicate_sku(request.sku)
     if is_duplicate:
         raise HTTPException(status_code=409, detail="SKU already exists")
 
-    product = save_product(result["data"])
-    return {"status": "created", "product": product}
+    product = await save_product(result["data"])
+    return ProductResponse(status="created", product=product)
 
 
 @app.get("/products/{product_id}")
 @step(name="Get Product", description="Retrieve a single product by ID")
-async def get_product(product_id: str) -> dict:
-    product = lookup_product(product_id)
+async def get_product(product_id: str) -> ProductResponse:
+    product = await lookup_product(product_id)
     if product is None:
         raise HTTPException(status_code=404, detail="Product not found")
-    return {"status": "ok", "product": product}
+    return ProductResponse(status="ok", product=product)
 
 
 @app.put("/products/{product_id}")
 @step(name="Update Product", description="Validate and apply changes to an existing product")
-async def update_product(product_id: str, request: UpdateProductRequest) -> dict:
-    existing = lookup_product(product_id)
+async def update_product(product_id: str, request: UpdateProductRequest) -> ProductResponse:
+    existing = await lookup_product(product_id)
     if existing is None:
         raise HTTPException(status_code=404, detail="Product not found")
 
-    updates = {k: v for k, v in asdict(request).items() if v is not None}
-    result = validate_product_data({**existing, **updates})
+    updates = {n: v for n in _UPDATE_FIELDS if (v := getattr(request, n)) is not None}
+    result = await validate_product_data({**existing, **updates})
     if not result["valid"]:
         raise HTTPException(status_code=422, detail=result["errors"])
 
-    product = apply_update(product_id, updates)
-    return {"status": "updated", "product": product}
+    product = await apply_update(product_id, updates)
+    return ProductResponse(status="updated", product=product)
 
 
 @app.delete("/products/{product_id}", status_code=204)
@@ -164,15 +183,15 @@ async def delete_product(
     product_id: str,
     hard: bool = Query(default=False, description="Permanently remove instead of soft-delete"),
 ) -> None:
-    existing = lookup_product(product_id)
+    existing = await lookup_product(product_id)
     if existing is None:
         raise HTTPException(status_code=404, detail="Product not found")
 
-    has_orders = check_order_references(product_id)
+    has_orders = await check_order_references(product_id)
     if has_orders:
-        soft_delete(product_id)
+        await soft_delete(product_id)
     else:
         if hard:
-            hard_delete(product_id)
+            await hard_delete(product_id)
         else:
-            soft_delete(product_id)
+            await soft_delete(product_id)
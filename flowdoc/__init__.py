@@ -2,23 +2,30 @@
 
 This package provides decorators to annotate business process steps in Python code,
 and tools to automatically generate flow diagrams from those annotations.
+
+Only the decorators are imported eagerly. Application code does ``from flowdoc
+import flow, step`` at import time, so the parser, generators and validator are
+loaded on first attribute access instead (PEP 562).
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from flowdoc.decorators import flow, step
-from flowdoc.discovery import discover_python_files
-from flowdoc.generator import (
-    DiagramGenerator,
-    MermaidGenerator,
-    create_generator,
-)
-from flowdoc.models import Edge, FlowData, StepData
-from flowdoc.parser import FlowParser, StepRegistry
-from flowdoc.validator import FlowValidator, ValidationMessage
-
-try:
-    from flowdoc.generator import GraphvizGenerator
-except ImportError:
-    pass
+
+if TYPE_CHECKING:
+    from flowdoc.discovery import discover_python_files, iter_python_files
+    from flowdoc.generator import (
+        DiagramGenerator,
+        GraphvizGenerator,
+        MermaidGenerator,
+        create_generator,
+    )
+    from flowdoc.models import Edge, FlowData, StepData
+    from flowdoc.parser import FlowParser, StepRegistry
+    from flowdoc.validator import FlowValidator, ValidationMessage
 
 __version__ = "0.0.0-rc.3"
 
@@ -26,6 +33,7 @@ __all__ = [
     "flow",
     "step",
     "discover_python_files",
+    "iter_python_files",
     "FlowParser",
     "StepRegistry",
     "FlowData",
@@ -38,3 +46,55 @@ __all__ = [
     "FlowValidator",
     "ValidationMessage",
 ]
+
+# Public name -> module that defines it, for names loaded on first access
+_LAZY_IMPORTS: dict[str, str] = {
+    "discover_python_files": "flowdoc.discovery",
+    "iter_python_files": "flowdoc.discovery",
+    "FlowParser": "flowdoc.parser",
+    "StepRegistry": "flowdoc.parser",
+    "FlowData": "flowdoc.models",
+    "StepData": "flowdoc.models",
+    "Edge": "flowdoc.models",
+    "DiagramGenerator": "flowdoc.generator",
+    "GraphvizGenerator": "flowdoc.generator",
+    "MermaidGenerator": "flowdoc.generator",
+    "create_generator": "flowdoc.generator",
+    "FlowValidator": "flowdoc.validator",
+    "ValidationMessage": "flowdoc.validator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access.
+
+    Submodules such as ``flowdoc.parser`` are imported on access too, as they were
+    when the package imported them eagerly.
+
+    :param name: Attribute being looked up on the package
+    :return: The requested object or submodule
+    :raises AttributeError: If ``name`` is neither a public FlowDoc name nor a submodule
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        if not name.startswith("__"):
+            submodule = f"{__name__}.{name}"
+            try:
+                return importlib.import_module(submodule)
+            except ModuleNotFoundError as e:
+                # Only a missing submodule means "no such attribute"; re-raise anything
+                # missing further down, such as an uninstalled dependency
+                if e.name != submodule:
+                    raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including names that have not been loaded yet.
+
+    :return: Sorted attribute names
+    """
+    return sorted(set(globals()) | set(__all__))
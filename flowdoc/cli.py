@@ -14,6 +14,9 @@ from flowdoc.generator import create_generator
 from flowdoc.parser import FlowParser
 from flowdoc.validator import FlowValidator
 
+_NON_WORD_RE = re.compile(r"[^\w\s-]")
+_SEPARATOR_RE = re.compile(r"[\s-]+")
+
 
 def _slugify(name: str) -> str:
     """Convert a flow name to a filesystem-safe slug.
@@ -24,8 +27,8 @@ def _slugify(name: str) -> str:
     :return: Lowercased filesystem-safe slug
     """
     slug = name.lower()
-    slug = re.sub(r"[^\w\s-]", "", slug)
-    slug = re.sub(r"[\s-]+", "_", slug)
+    slug = _NON_WORD_RE.sub("", slug)
+    slug = _SEPARATOR_RE.sub("_", slug)
     return slug.strip("_")
 
 
@@ -105,30 +108,24 @@ def generate(
         raise click.ClickException(str(e)) from None
     generated_count = 0
 
-    # Use parse_directory for directory input (cross-module support)
-    if source_path.is_dir():
-        flows = parser.parse_directory(source_path, src_root=src_root, exclude=exclude_set)
-    else:
-        # Single file: still use discovery for consistency, then parse_directory
-        flows = parser.parse_directory(source_path, src_root=src_root, exclude=exclude_set)
+    # parse_directory accepts a single file too, so both inputs share one code path
+    flows = parser.parse_directory(source_path, src_root=src_root, exclude=exclude_set)
 
     if not flows:
         click.echo("No flows found in the specified source.", err=True)
         raise SystemExit(1)
 
-    for flow_data in flows:
-        if output:
-            output_path = Path(output)
-        else:
-            slug = _slugify(flow_data.name)
-            output_path = Path(slug)
+    jobs = [
+        (flow_data, Path(output) if output else Path(_slugify(flow_data.name)))
+        for flow_data in flows
+    ]
 
-        try:
-            result = generator.generate(flow_data, output_path)
+    for (flow_data, _output_path), result in zip(jobs, generator.generate_many(jobs), strict=True):
+        if isinstance(result, Exception):
+            click.echo(f"Error generating diagram for '{flow_data.name}': {result}", err=True)
+        else:
             click.echo(f"Generated: {result}")
             generated_count += 1
-        except Exception as e:
-            click.echo(f"Error generating diagram for '{flow_data.name}': {e}", err=True)
 
     if generated_count == 0:
         click.echo("No flows found in the specified source.", err=True)
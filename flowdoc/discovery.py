@@ -1,5 +1,8 @@
 """File discovery for cross-module flow analysis."""
 
+import os
+import stat
+from collections.abc import Iterator
 from pathlib import Path
 
 DEFAULT_EXCLUDES = frozenset(
@@ -30,8 +33,16 @@ def is_test_file(path: Path) -> bool:
     :param path: Path to check
     :return: True if the file matches test naming patterns
     """
-    name = path.stem
-    return name.startswith("test_") or name.endswith("_test") or name == "conftest"
+    return _is_test_stem(path.stem)
+
+
+def _is_test_stem(stem: str) -> bool:
+    """Check if a file stem matches test naming patterns.
+
+    :param stem: File name without its extension
+    :return: True if the stem matches test naming patterns
+    """
+    return stem.startswith("test_") or stem.endswith("_test") or stem == "conftest"
 
 
 def discover_python_files(
@@ -45,44 +56,89 @@ def discover_python_files(
 
     :param root: Directory to search, or a single .py file.
     :param exclude_patterns: Additional directory names to exclude.
-    :return: List of Path objects for discovered .py files.
+    :return: Sorted list of Path objects for discovered .py files.
+    :raises FileNotFoundError: If root does not exist.
+    :raises ValueError: If root is not a directory or .py file.
+    """
+    # Path ordering compares component by component, matching a sorted recursive walk
+    return sorted(iter_python_files(root, exclude_patterns))
+
+
+def iter_python_files(
+    root: Path,
+    exclude_patterns: set[str] | None = None,
+) -> Iterator[Path]:
+    """Lazily discover Python files, yielding each one as the walk reaches it.
+
+    Applies the same exclusions as :func:`discover_python_files`, but files come in
+    directory order rather than sorted, so callers can start work on the first file
+    before the whole tree has been listed. ``root`` is checked immediately.
+
+    :param root: Directory to search, or a single .py file.
+    :param exclude_patterns: Additional directory names to exclude.
+    :return: Iterator over Path objects for discovered .py files.
     :raises FileNotFoundError: If root does not exist.
     :raises ValueError: If root is not a directory or .py file.
     """
     root = root.resolve()
 
-    if not root.exists():
-        raise FileNotFoundError(f"Path does not exist: {root}")
+    # One stat call answers exists/is_file/is_dir
+    try:
+        mode = root.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        raise FileNotFoundError(f"Path does not exist: {root}") from None
 
-    if root.is_file():
+    if stat.S_ISREG(mode):
         if root.suffix == ".py":
-            return [root]
+            return iter([root])
         raise ValueError(f"Not a Python file: {root}")
 
-    if not root.is_dir():
+    if not stat.S_ISDIR(mode):
         raise ValueError(f"Not a file or directory: {root}")
 
-    excludes = DEFAULT_EXCLUDES | (exclude_patterns or set())
-    python_files: list[Path] = []
+    return _walk(root, DEFAULT_EXCLUDES | (exclude_patterns or set()))
+
 
-    def _should_exclude_dir(dir_path: Path) -> bool:
-        if dir_path.name.startswith("."):
-            return True
-        return dir_path.name in excludes
+def _walk(root: Path, excludes: frozenset[str]) -> Iterator[Path]:
+    """Yield non-test .py files below a directory, skipping excluded directories.
 
-    def _walk(directory: Path) -> None:
+    :param root: Resolved directory to search
+    :param excludes: Directory names to skip
+    :return: Iterator over discovered files, in directory order
+    """
+
+    def _scan(directory: str) -> list[os.DirEntry[str]]:
+        # os.scandir reuses the file type reported by readdir, so is_dir()/is_file()
+        # normally cost no extra stat call; Path objects are only built for results.
         try:
-            entries = sorted(directory.iterdir())
+            with os.scandir(directory) as it:
+                return list(it)
         except PermissionError:
-            return
-
-        for entry in entries:
-            if entry.is_dir():
-                if not _should_exclude_dir(entry):
-                    _walk(entry)
-            elif entry.is_file() and entry.suffix == ".py":
-                if not is_test_file(entry):
-                    python_files.append(entry)
-
-    _walk(root)
-    return python_files
+            return []
+
+    def _is_dir(entry: os.DirEntry[str]) -> bool:
+        # Like Path.is_dir(), an entry that cannot be stat'ed (e.g. a symlink
+        # loop raising ELOOP) counts as neither a directory nor a file
+        try:
+            return entry.is_dir()
+        except OSError:
+            return False
+
+    def _is_file(entry: os.DirEntry[str]) -> bool:
+        try:
+            return entry.is_file()
+        except OSError:
+            return False
+
+    # Walk with an explicit stack so deep trees cannot hit the recursion limit
+    pending = [os.fspath(root)]
+    while pending:
+        for entry in _scan(pending.pop()):
+            if _is_dir(entry):
+                # Hidden directories are skipped along with the exclude set
+                name = entry.name
+                if not (name.startswith(".") or name in excludes):
+                    pending.append(entry.path)
+            elif entry.name.endswith(".py") and _is_file(entry):
+                if not _is_test_stem(entry.name[:-3]):
+                    yield Path(entry.path)
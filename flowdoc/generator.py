@@ -5,12 +5,38 @@ Supports Graphviz (PNG, SVG, PDF, DOT) and Mermaid output formats.
 
 from __future__ import annotations
 
+import importlib.util
+import os
 import re
 from abc import ABC, abstractmethod
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
 
 from flowdoc.models import Edge, FlowData, StepData
 
+try:
+    from graphviz import Digraph as _Digraph
+except ImportError:  # Optional 'graphviz' extra
+    _Digraph = None
+
+# Characters not allowed in a Mermaid node ID
+_ID_RE = re.compile(r"[^a-zA-Z0-9_]")
+_SAFE_ID = re.compile(r"[a-zA-Z0-9_]+").fullmatch
+# Characters that force a Mermaid label to be quoted
+_MERMAID_SPECIAL = re.compile(r'[\[\]{}()|"]')
+
+
+@cache
+def _has_jinja2() -> bool:
+    """Check once per process whether the optional 'html' extra is installed.
+
+    :return: True if jinja2 can be imported
+    """
+    return importlib.util.find_spec("jinja2") is not None
+
 
 class DiagramGenerator(ABC):
     """Base class for all diagram generators.
@@ -18,6 +44,9 @@ class DiagramGenerator(ABC):
     Subclasses must implement :meth:`generate` to produce output files.
     """
 
+    # Edge label by branch type; unconditional edges have no entry
+    BRANCH_LABELS: dict[str | None, str] = {"if": "yes", "else": "no"}
+
     @abstractmethod
     def generate(self, flow_data: FlowData, output_path: Path) -> Path:
         """Generate a diagram from flow data.
@@ -28,33 +57,108 @@ class DiagramGenerator(ABC):
         """
         ...
 
+    def generate_many(
+        self, jobs: Sequence[tuple[FlowData, Path]], workers: int | None = None
+    ) -> list[Path | Exception]:
+        """Generate diagrams for several flows.
+
+        Rendered formats spend most of their time in the Graphviz subprocess, so
+        independent outputs are produced on a thread pool. Text formats are pure
+        Python and gain nothing from threads, so they run serially. Jobs that share
+        an output path run sequentially in submission order, so the last flow still wins.
+
+        A failing job does not stop the batch: its exception is returned in place
+        of the generated path.
+
+        :param jobs: ``(flow_data, output_path)`` pairs
+        :param workers: Maximum number of threads; defaults to the CPU count for
+            subprocess-backed formats and 1 otherwise
+        :return: Generated path or raised exception for each job, in job order
+        """
+        groups: dict[Path, list[int]] = {}
+        for index, (_flow_data, output_path) in enumerate(jobs):
+            # with_suffix() raises on an empty name; such jobs fail inside run() instead
+            key = output_path.with_suffix("") if output_path.name else output_path
+            groups.setdefault(key, []).append(index)
+
+        def run(indices: list[int]) -> list[tuple[int, Path | Exception]]:
+            done: list[tuple[int, Path | Exception]] = []
+            for index in indices:
+                flow_data, output_path = jobs[index]
+                try:
+                    done.append((index, self.generate(flow_data, output_path)))
+                except Exception as e:
+                    done.append((index, e))
+            return done
+
+        if workers is None:
+            workers = (os.cpu_count() or 1) if self._renders_in_subprocess() else 1
+        workers = min(workers, len(groups))
+
+        results: dict[int, Path | Exception] = {}
+        if workers <= 1:
+            for indices in groups.values():
+                results.update(run(indices))
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for done in executor.map(run, groups.values()):
+                    results.update(done)
+        return [results[index] for index in range(len(jobs))]
+
+    def _renders_in_subprocess(self) -> bool:
+        """Whether :meth:`generate` spends its time in an external process.
+
+        :return: True if batch generation benefits from running jobs on threads
+        """
+        return False
+
     @staticmethod
     def _classify_step(step: StepData, edges: list[Edge]) -> str:
         """Classify a step by its outgoing edge count.
 
+        Convenience wrapper for single lookups; renderers should count edges once
+        with :meth:`_count_outgoing` and call :meth:`_classify_from_counts`.
+
         :param step: The step to classify
         :param edges: All edges in the flow
         :return: One of 'decision', 'terminal', or 'regular'
         """
-        outgoing = [e for e in edges if e.from_step == step.function_name]
-        if len(outgoing) == 0:
+        return DiagramGenerator._classify_from_counts(
+            step.function_name, DiagramGenerator._count_outgoing(edges)
+        )
+
+    @staticmethod
+    def _count_outgoing(edges: list[Edge]) -> Counter[str]:
+        """Count outgoing edges per source step in a single pass.
+
+        :param edges: All edges in the flow
+        :return: Mapping of step function name to its outgoing edge count
+        """
+        return Counter(e.from_step for e in edges)
+
+    @staticmethod
+    def _classify_from_counts(function_name: str, out_counts: Mapping[str, int]) -> str:
+        """Classify a step from precomputed outgoing edge counts.
+
+        :param function_name: Function name of the step to classify
+        :param out_counts: Outgoing edge count per step, from :meth:`_count_outgoing`
+        :return: One of 'decision', 'terminal', or 'regular'
+        """
+        outgoing = out_counts.get(function_name, 0)
+        if outgoing == 0:
             return "terminal"
-        if len(outgoing) >= 2:
+        if outgoing >= 2:
             return "decision"
         return "regular"
 
-    @staticmethod
-    def _get_branch_label(branch: str | None) -> str | None:
+    @classmethod
+    def _get_branch_label(cls, branch: str | None) -> str | None:
         """Convert branch type to a human-readable label.
 
         :param branch: Branch type ('if', 'else', or None)
         :return: Label string or None
         """
-        if branch == "if":
-            return "yes"
-        if branch == "else":
-            return "no"
-        return None
+        return cls.BRANCH_LABELS.get(branch)
 
 
 class GraphvizGenerator(DiagramGenerator):
@@ -91,6 +195,13 @@ class GraphvizGenerator(DiagramGenerator):
         self.direction = direction
         self.include_docstrings = include_docstrings
 
+    def _renders_in_subprocess(self) -> bool:
+        """Whether :meth:`generate` spends its time in an external process.
+
+        :return: True for rendered formats, which run the ``dot`` binary
+        """
+        return self.output_format != "dot"
+
     def generate(self, flow_data: FlowData, output_path: Path) -> Path:
         """Generate a Graphviz diagram.
 
@@ -103,14 +214,13 @@ class GraphvizGenerator(DiagramGenerator):
         if self.output_format == "dot":
             # Write DOT source directly
             dot_path = output_path.with_suffix(".dot")
-            dot_path.write_text(dot.source, encoding="utf-8")
+            dot_path.write_bytes(dot.source.encode("utf-8"))
             return dot_path
 
         # Render to image format
         # graphviz.render() appends the format extension automatically
-        stem = str(output_path.with_suffix(""))
-        dot.render(filename=stem, format=self.output_format, cleanup=True)
-        return Path(f"{stem}.{self.output_format}")
+        dot.render(filename=output_path.with_suffix(""), format=self.output_format, cleanup=True)
+        return output_path.with_suffix("." + self.output_format)
 
     def _create_graph(self, flow_data: FlowData) -> object:
         """Create a Graphviz Digraph from flow data.
@@ -118,32 +228,39 @@ class GraphvizGenerator(DiagramGenerator):
         :param flow_data: The flow data to render
         :return: Configured Digraph object
         """
-        from graphviz import Digraph
+        if _Digraph is None:
+            raise ImportError(
+                "Graphviz output requires the 'graphviz' extra. Install with:\n"
+                "    pip install flowdoc[graphviz]"
+            )
 
-        dot = Digraph(
+        dot = _Digraph(
             name=flow_data.name,
             comment=flow_data.description or flow_data.name,
         )
         dot.attr(rankdir=self.direction)
         dot.attr("graph", label=flow_data.name, labelloc="t", fontsize="16")
 
-        self._add_nodes(dot, flow_data)
+        out_counts = self._count_outgoing(flow_data.edges)
+        self._add_nodes(dot, flow_data, out_counts)
         self._add_edges(dot, flow_data.edges)
 
         return dot
 
-    def _add_nodes(self, dot: object, flow_data: FlowData) -> None:
+    def _add_nodes(self, dot: object, flow_data: FlowData, out_counts: Mapping[str, int]) -> None:
         """Add styled nodes to the graph.
 
         :param dot: Graphviz Digraph to add nodes to
         :param flow_data: Flow data containing steps and edges
+        :param out_counts: Outgoing edge count per step, from :meth:`_count_outgoing`
         """
         for step in flow_data.steps:
-            classification = self._classify_step(step, flow_data.edges)
-            style = dict(self.NODE_STYLES[classification])
+            classification = self._classify_from_counts(step.function_name, out_counts)
+            style = self.NODE_STYLES[classification]  # Shared; unpacked, never mutated
             if self.include_docstrings and step.docstring:
-                style["tooltip"] = step.docstring
-            dot.node(step.function_name, label=step.name, **style)
+                dot.node(step.function_name, label=step.name, **style, tooltip=step.docstring)
+            else:
+                dot.node(step.function_name, label=step.name, **style)
 
     def _add_edges(self, dot: object, edges: list[Edge]) -> None:
         """Add edges to the graph.
@@ -152,11 +269,11 @@ class GraphvizGenerator(DiagramGenerator):
         :param edges: List of edges to add
         """
         for edge in edges:
-            attrs: dict[str, str] = {}
             label = self._get_branch_label(edge.branch)
-            if label:
-                attrs["label"] = label
-            dot.edge(edge.from_step, edge.to_step, **attrs)
+            if label is None:
+                dot.edge(edge.from_step, edge.to_step)
+            else:
+                dot.edge(edge.from_step, edge.to_step, label=label)
 
 
 class MermaidGenerator(DiagramGenerator):
@@ -195,7 +312,8 @@ class MermaidGenerator(DiagramGenerator):
         """
         mermaid_text = self._render(flow_data)
         mmd_path = output_path.with_suffix(".mmd")
-        mmd_path.write_text(mermaid_text, encoding="utf-8")
+        # One encode and one binary write; also keeps LF line endings on every platform
+        mmd_path.write_bytes(mermaid_text.encode("utf-8"))
         return mmd_path
 
     def _render(self, flow_data: FlowData) -> str:
@@ -204,34 +322,38 @@ class MermaidGenerator(DiagramGenerator):
         :param flow_data: The flow data to render
         :return: Mermaid flowchart string
         """
-        lines: list[str] = [f"flowchart {self.direction}"]
+        # Pieces are concatenated by a single join at the end; each line carries its own "\n"
+        parts: list[str] = ["flowchart ", self.direction, "\n"]
 
         # Add nodes
+        out_counts = self._count_outgoing(flow_data.edges)
+        # Edge endpoints are nearly always nodes of this flow; reuse their IDs
+        id_cache: dict[str, str] = {}
         for step in flow_data.steps:
-            node_id = self._sanitize_id(step.function_name)
-            classification = self._classify_step(step, flow_data.edges)
+            node_id = id_cache[step.function_name] = self._sanitize_id(step.function_name)
+            classification = self._classify_from_counts(step.function_name, out_counts)
             label = self._escape_label(step.name)
             node_def = self._node_shape(node_id, label, classification)
-            lines.append(f"    {node_def}")
+            parts.extend(("    ", node_def, "\n"))
             if self.include_docstrings and step.docstring:
-                for doc_line in step.docstring.splitlines():
-                    lines.append(f"    %% {doc_line}")
+                doc_lines = step.docstring.splitlines()
+                parts.extend(("    %% ", "\n    %% ".join(doc_lines), "\n"))
 
         # Blank line between nodes and edges
         if flow_data.edges:
-            lines.append("")
+            parts.append("\n")
 
         # Add edges
         for edge in flow_data.edges:
-            from_id = self._sanitize_id(edge.from_step)
-            to_id = self._sanitize_id(edge.to_step)
+            from_id = id_cache.get(edge.from_step) or self._sanitize_id(edge.from_step)
+            to_id = id_cache.get(edge.to_step) or self._sanitize_id(edge.to_step)
             label = self._get_branch_label(edge.branch)
             if label:
-                lines.append(f"    {from_id} -->|{label}| {to_id}")
+                parts.extend(("    ", from_id, " -->|", label, "| ", to_id, "\n"))
             else:
-                lines.append(f"    {from_id} --> {to_id}")
+                parts.extend(("    ", from_id, " --> ", to_id, "\n"))
 
-        return "\n".join(lines) + "\n"
+        return "".join(parts)
 
     @staticmethod
     def _node_shape(node_id: str, label: str, classification: str) -> str:
@@ -254,9 +376,12 @@ class MermaidGenerator(DiagramGenerator):
         :param name: Raw function name
         :return: Safe Mermaid node ID
         """
-        sanitized = re.sub(r"[^a-zA-Z0-9_]", "_", name)
-        if sanitized.lower() in self.RESERVED_WORDS:
-            sanitized = f"step_{sanitized}"
+        # Most function names are already valid IDs; skip the substitution for them
+        sanitized = name if _SAFE_ID(name) else _ID_RE.sub("_", name)
+        # Function names are usually lowercase already; avoid allocating a copy
+        key = sanitized if sanitized.islower() else sanitized.lower()
+        if key in self.RESERVED_WORDS:
+            sanitized = "step_" + sanitized
         return sanitized
 
     @staticmethod
@@ -267,10 +392,9 @@ class MermaidGenerator(DiagramGenerator):
         :return: Escaped label text safe for Mermaid
         """
         # Mermaid uses quotes for labels with special chars
-        if any(c in label for c in '[]{}()|"'):
-            escaped = label.replace('"', "#quot;")
-            return f'"{escaped}"'
-        return label
+        if _MERMAID_SPECIAL.search(label) is None:
+            return label
+        return '"' + label.replace('"', "#quot;") + '"'
 
 
 def create_generator(output_format: str, **kwargs: object) -> DiagramGenerator:
@@ -287,24 +411,20 @@ def create_generator(output_format: str, **kwargs: object) -> DiagramGenerator:
     if output_format == "dot":
         return GraphvizGenerator(output_format=output_format, **kwargs)
     if output_format in ("png", "svg", "pdf"):
-        try:
-            import graphviz  # noqa: F401
-        except ImportError:
+        if _Digraph is None:
             raise ImportError(
                 f"{output_format.upper()} output requires the 'graphviz' extra. Install with:\n"
                 "    pip install flowdoc[graphviz]\n\n"
                 "Alternatively, use --format mermaid or --format dot which have no additional "
                 "dependencies."
-            ) from None
+            )
         return GraphvizGenerator(output_format=output_format, **kwargs)
     if output_format == "html":
-        try:
-            import jinja2  # noqa: F401
-        except ImportError:
+        if not _has_jinja2():
             raise ImportError(
                 "HTML output requires the 'html' extra. Install with:\n"
                 "    pip install flowdoc[html]"
-            ) from None
+            )
         raise NotImplementedError("HTML generator not yet implemented")
     raise ValueError(
         f"Unsupported format: {output_format}. Supported: png, svg, pdf, dot, mermaid, html"
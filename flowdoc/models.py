@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Edge:
     from_step: str
     to_step: str
@@ -9,7 +9,7 @@ class Edge:
     line_number: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StepData:
     name: str
     function_name: str
@@ -18,7 +18,7 @@ class StepData:
     calls: list[Edge] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowData:
     name: str
     type: str
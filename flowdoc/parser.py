@@ -4,11 +4,92 @@ This module uses pure AST analysis to discover flows and steps without executing
 """
 
 import ast
+import os
 import warnings
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from flowdoc.models import Edge, FlowData, StepData
 
+# Exact node types of function definitions. ast.parse never produces subclasses, so
+# `type(node) in _FUNCTION_DEF_TYPES` is an identity check instead of an isinstance walk.
+_FUNCTION_DEF_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+
+# Maximum number of parsed files kept in the cache before the least recently used is evicted
+_PARSE_CACHE_SIZE = 1024
+
+
+@dataclass(slots=True)
+class _ModuleSteps:
+    """The @step functions and methods collected from one module.
+
+    :param by_name: Every collected step by function name
+    :param by_class: @step methods of each class, by method name, in body order
+    """
+
+    by_name: dict[str, ast.FunctionDef] = field(default_factory=dict)
+    by_class: dict[ast.ClassDef, dict[str, ast.FunctionDef]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _ParsedFile:
+    """A parsed source file, stamped with the file's stat result when read.
+
+    :param stamp: ``(st_mtime_ns, st_size, st_ctime_ns, st_ino)`` of the file when parsed
+    :param tree: Parsed module AST
+    :param steps: Collected @step nodes, keyed by the parser class that collected them
+    """
+
+    stamp: tuple[int, int, int, int]
+    tree: ast.Module
+    steps: dict[type, _ModuleSteps] = field(default_factory=dict)
+
+
+# Parsed files keyed by absolute path, in least- to most-recently-used order. Repeated
+# parses in one process (validate then generate, watch loops) reuse the tree and collected
+# steps for unchanged files; an edited file gets a new stamp and is parsed again. The
+# change time and inode catch rewrites that restore the old mtime (cp -p, rsync -a, tar x).
+_parse_cache: OrderedDict[Path, _ParsedFile] = OrderedDict()
+
+
+def clear_parse_cache() -> None:
+    """Clear the cache of parsed module ASTs.
+
+    Useful for testing, or to release memory after parsing a large tree.
+    """
+    _parse_cache.clear()
+
+
+def _load_source_file(file_path: Path, markers: tuple[bytes, ...] = ()) -> _ParsedFile | None:
+    """Parse a Python file, reusing the cached entry while the file is unchanged.
+
+    :param file_path: Path to Python source file
+    :param markers: If given, skip parsing files whose source contains none of them
+    :return: Cache entry holding the parsed module AST, or None if the file was skipped
+    :raises SyntaxError: If the file cannot be parsed
+    """
+    # Absolute keys keep relative paths from resolving to another file after os.chdir()
+    key = Path(os.path.abspath(file_path))
+    stat = file_path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size, stat.st_ctime_ns, stat.st_ino)
+    cached = _parse_cache.get(key)
+    if cached is not None and cached.stamp == stamp:
+        _parse_cache.move_to_end(key)
+        return cached
+
+    # Bytes go straight to the tokenizer, which honours BOMs and coding declarations
+    source = file_path.read_bytes()
+    if markers and not any(marker in source for marker in markers):
+        return None
+    tree = ast.parse(source, filename=str(file_path))
+    entry = _ParsedFile(stamp, tree)
+    _parse_cache[key] = entry
+    _parse_cache.move_to_end(key)
+    if len(_parse_cache) > _PARSE_CACHE_SIZE:
+        _parse_cache.popitem(last=False)
+    return entry
+
 
 class FlowCallVisitor(ast.NodeVisitor):
     """AST visitor to find calls to other @step decorated functions/methods.
@@ -19,12 +100,14 @@ class FlowCallVisitor(ast.NodeVisitor):
     3. Async calls: await other_function()
     """
 
-    def __init__(self, decorated_steps: set[str]) -> None:
+    def __init__(self, decorated_steps: set[str], from_step: str = "") -> None:
         """Initialize visitor.
 
         :param decorated_steps: set of function/method names that have @step decorator
+        :param from_step: Function name of the step being visited, recorded on each call
         """
         self.decorated_steps = decorated_steps
+        self.from_step = from_step
         self.calls_to_steps: list[Edge] = []
         self.current_branch: str | None = None  # Track if we're in an if/else
 
@@ -47,7 +130,7 @@ class FlowCallVisitor(ast.NodeVisitor):
         if target_name and target_name in self.decorated_steps:
             self.calls_to_steps.append(
                 Edge(
-                    from_step="",
+                    from_step=self.from_step,
                     to_step=target_name,
                     branch=self.current_branch,
                     line_number=node.lineno,
@@ -143,7 +226,10 @@ class StepRegistry:
 
     def __init__(self) -> None:
         self._steps: dict[str, StepData] = {}  # qualified_name -> StepData
-        self._module_steps: dict[str, list[str]] = {}  # module_path -> [qualified_names]
+        # module_path -> [qualified_names]
+        self._module_steps: defaultdict[str, list[str]] = defaultdict(list)
+        # function_name -> [qualified_names]; only read with .get() so no keys are added
+        self._by_simple_name: defaultdict[str, list[str]] = defaultdict(list)
 
     def register(self, module_path: str, step: StepData) -> None:
         """Register a step from a module.
@@ -152,9 +238,9 @@ class StepRegistry:
         :param step: Step data to register
         """
         qualified_name = f"{module_path}.{step.function_name}"
+        if qualified_name not in self._steps:
+            self._by_simple_name[step.function_name].append(qualified_name)
         self._steps[qualified_name] = step
-        if module_path not in self._module_steps:
-            self._module_steps[module_path] = []
         self._module_steps[module_path].append(qualified_name)
 
     def resolve(self, from_module: str, call_name: str) -> StepData | None:
@@ -178,13 +264,23 @@ class StepRegistry:
         if qualified in self._steps:
             return self._steps[qualified]
 
-        # Try matching just the function name (for imports)
-        for qname, step in self._steps.items():
-            if qname.endswith(f".{call_name}"):
-                return step
+        # Try matching just the function name (for imports). Only steps whose function
+        # name is the last component of call_name can end with it.
+        candidates = self._by_simple_name.get(call_name.rpartition(".")[2], ())
+        suffix = f".{call_name}"
+        for qname in candidates:
+            if qname.endswith(suffix):
+                return self._steps[qname]
 
         return None
 
+    def function_names(self) -> set[str]:
+        """Return the function names of all registered steps.
+
+        :return: Set of step function names
+        """
+        return set(self._by_simple_name)
+
     def all_steps(self) -> list[StepData]:
         """Return all registered steps.
 
@@ -200,8 +296,8 @@ class FlowParser:
     """
 
     # Recognized decorator names
-    FLOW_DECORATOR_NAMES = {"flow", "business_flow"}
-    STEP_DECORATOR_NAMES = {"step", "business_step", "flow_step"}
+    FLOW_DECORATOR_NAMES = frozenset({"flow", "business_flow"})
+    STEP_DECORATOR_NAMES = frozenset({"step", "business_step", "flow_step"})
 
     def parse_file(self, file_path: Path) -> list[FlowData]:
         """Extract all flows from a Python file using AST analysis.
@@ -209,59 +305,115 @@ class FlowParser:
         :param file_path: Path to Python source file
         :return: List of flow data dictionaries
         """
-        # Read source code
-        with open(file_path, encoding="utf-8") as f:
-            source = f.read()
-
-        # Parse into AST
+        # Read and parse source code (cached while the file is unchanged). No markers are
+        # passed: a file named explicitly is always parsed, so syntax errors still raise.
         try:
-            tree = ast.parse(source)
+            entry = _load_source_file(Path(file_path))
         except SyntaxError as e:
             raise SyntaxError(f"Cannot parse {file_path}: {e}") from e
 
-        flows: list[FlowData] = []
-
         # First pass: collect all @step decorated functions/methods
-        all_steps = self._collect_all_steps(tree)
+        module_steps = self._cached_steps(entry)
+
+        # Second pass: extract class, factory and function flows
+        return self._extract_flows(entry.tree, module_steps, set(module_steps.by_name))
+
+    def _source_markers(self) -> tuple[bytes, ...]:
+        """Return byte strings at least one of which any flow source file must contain.
+
+        A decorator can only be recognised if its name appears in the source text,
+        so files without any of the names cannot contain steps or flows.
+
+        :return: Encoded step and flow decorator names
+        """
+        return tuple(
+            name.encode() for name in self.STEP_DECORATOR_NAMES | self.FLOW_DECORATOR_NAMES
+        )
+
+    def _cached_steps(self, entry: _ParsedFile) -> _ModuleSteps:
+        """Collect @step nodes for a cached file, reusing an earlier collection.
+
+        :param entry: Cache entry from :func:`_load_source_file`
+        :return: Steps collected from the file's tree
+        """
+        # Keyed by class, since subclasses may recognise different decorator names
+        steps = entry.steps.get(type(self))
+        if steps is None:
+            steps = entry.steps[type(self)] = self._collect_all_steps(entry.tree)
+        return steps
+
+    def _extract_flows(
+        self,
+        tree: ast.Module,
+        local_steps: _ModuleSteps,
+        callable_steps: set[str],
+    ) -> list[FlowData]:
+        """Extract all flows from a module in a single pass over its body.
+
+        Flows are returned in a fixed order: class-based flows, then @flow factory
+        functions, then the implicit flow of standalone @step functions.
+
+        :param tree: AST Module node
+        :param local_steps: @step functions/methods defined in this module
+        :param callable_steps: All step names usable as call targets
+        :return: List of FlowData objects from this module
+        """
+        class_flows: list[FlowData] = []
+        factory_flows: list[FlowData] = []
+        function_steps: list[ast.FunctionDef] = []
 
-        # Second pass: extract class-based flows (with @flow decorator)
         for node in tree.body:
             if isinstance(node, ast.ClassDef):
-                flow_data = self._extract_class_flow(node, all_steps, tree)
+                decorated_methods = local_steps.by_class.get(node, {})
+                flow_data = self._extract_class_flow(node, decorated_methods, callable_steps, tree)
                 if flow_data:
-                    flows.append(flow_data)
-
-        # Third pass: extract @flow decorated factory functions
-        for node in tree.body:
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    class_flows.append(flow_data)
+            elif type(node) in _FUNCTION_DEF_TYPES:
                 if self._has_flow_decorator(node):
-                    flow_data = self._extract_factory_flow(node, all_steps)
+                    flow_data = self._extract_factory_flow(node, callable_steps)
                     if flow_data:
-                        flows.append(flow_data)
+                        factory_flows.append(flow_data)
+                # Standalone @step functions form the implicit function flow
+                if node.name in local_steps.by_name:
+                    function_steps.append(node)
 
-        # Fourth pass: extract function-based flow (standalone @step functions)
-        function_steps = self._extract_function_steps(tree, all_steps)
+        flows = class_flows + factory_flows
         if function_steps:
-            # Create an implicit flow from standalone functions
-            flow_data = self._create_function_flow(function_steps, all_steps, tree)
-            flows.append(flow_data)
-
+            flows.append(self._create_function_flow(function_steps, callable_steps, tree))
         return flows
 
-    def _collect_all_steps(self, tree: ast.Module) -> dict[str, ast.FunctionDef]:
+    def _collect_all_steps(self, tree: ast.Module) -> _ModuleSteps:
         """Collect all @step decorated functions and methods from AST.
 
+        Only the places a step can belong to a flow are searched: module-level
+        functions, methods directly in a class body, and functions nested anywhere
+        inside a @flow factory. Other function bodies are not descended into.
+
         :param tree: AST Module node
-        :return: Dictionary mapping step function names to their AST nodes
+        :return: Steps by function name, plus each class's @step methods
         """
-        steps: dict[str, ast.FunctionDef] = {}
+        collected = _ModuleSteps()
+        steps = collected.by_name
 
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        for node in tree.body:
+            if type(node) in _FUNCTION_DEF_TYPES:
                 if self._has_step_decorator(node):
                     steps[node.name] = node
-
-        return steps
+                if self._has_flow_decorator(node):
+                    for inner in ast.walk(node):
+                        if inner is not node and type(inner) in _FUNCTION_DEF_TYPES:
+                            if self._has_step_decorator(inner):
+                                steps[inner.name] = inner
+            elif isinstance(node, ast.ClassDef):
+                methods: dict[str, ast.FunctionDef] = {}
+                for member in node.body:
+                    if type(member) in _FUNCTION_DEF_TYPES:
+                        if self._has_step_decorator(member):
+                            steps[member.name] = methods[member.name] = member
+                if methods:
+                    collected.by_class[node] = methods
+
+        return collected
 
     def _has_step_decorator(self, node: ast.FunctionDef) -> bool:
         """Check if function has @step decorator.
@@ -274,30 +426,38 @@ class FlowParser:
                 return True
         return False
 
-    def _is_step_decorator(self, decorator: ast.expr) -> bool:
-        """Check if decorator is a @step variant.
+    @staticmethod
+    def _decorator_name(decorator: ast.expr) -> str | None:
+        """Return the name a decorator is matched on, or None if it has no usable name.
 
         Supports:
-        - @step(...)
-        - @flowdoc.step(...)
-        - @business_step(...)
+        - @step / @flow (no arguments)
+        - @step(...) / @flow(...)
+        - @flowdoc.step(...) / @flowdoc.flow(...)
 
         :param decorator: Decorator AST node
-        :return: True if it's a step decorator
+        :return: Bare decorator name, or None
         """
-        # Pattern 1: @step(name="...")
         if isinstance(decorator, ast.Call):
-            if isinstance(decorator.func, ast.Name):
-                return decorator.func.id in self.STEP_DECORATOR_NAMES
-            # Pattern 2: @flowdoc.step(name="...")
-            if isinstance(decorator.func, ast.Attribute):
-                return decorator.func.attr in self.STEP_DECORATOR_NAMES
+            func = decorator.func
+            if isinstance(func, ast.Name):
+                return func.id
+            if isinstance(func, ast.Attribute):
+                return func.attr
+            return None
 
-        # Pattern 3: @step (no arguments)
         if isinstance(decorator, ast.Name):
-            return decorator.id in self.STEP_DECORATOR_NAMES
+            return decorator.id
 
-        return False
+        return None
+
+    def _is_step_decorator(self, decorator: ast.expr) -> bool:
+        """Check if decorator is a @step variant.
+
+        :param decorator: Decorator AST node
+        :return: True if it's a step decorator
+        """
+        return self._decorator_name(decorator) in self.STEP_DECORATOR_NAMES
 
     def _has_flow_decorator(self, node: ast.ClassDef) -> bool:
         """Check if class has @flow decorator.
@@ -316,16 +476,7 @@ class FlowParser:
         :param decorator: Decorator AST node
         :return: True if it's a flow decorator
         """
-        if isinstance(decorator, ast.Call):
-            if isinstance(decorator.func, ast.Name):
-                return decorator.func.id in self.FLOW_DECORATOR_NAMES
-            if isinstance(decorator.func, ast.Attribute):
-                return decorator.func.attr in self.FLOW_DECORATOR_NAMES
-
-        if isinstance(decorator, ast.Name):
-            return decorator.id in self.FLOW_DECORATOR_NAMES
-
-        return False
+        return self._decorator_name(decorator) in self.FLOW_DECORATOR_NAMES
 
     @staticmethod
     def _extract_decorator_args(decorator: ast.expr) -> dict[str, str]:
@@ -363,55 +514,43 @@ class FlowParser:
     def _extract_class_flow(
         self,
         class_node: ast.ClassDef,
-        all_steps: dict[str, ast.FunctionDef],
+        decorated_methods: dict[str, ast.FunctionDef],
+        callable_steps: set[str],
         tree: ast.Module,
     ) -> FlowData | None:
         """Extract flow metadata from a @flow decorated class.
 
         :param class_node: Class definition AST node
-        :param all_steps: All available @step functions/methods
+        :param decorated_methods: The class's @step methods, from :meth:`_collect_all_steps`
+        :param callable_steps: Names of all @step functions/methods usable as call targets
         :param tree: Full module AST tree
         :return: Flow data dictionary or None if not a flow class
         """
-        # Check if this class has @flow decorator
-        if not self._has_flow_decorator(class_node):
+        # Find the @flow decorator; classes without one are not flows
+        flow_decorator = next(
+            (d for d in class_node.decorator_list if self._is_flow_decorator(d)), None
+        )
+        if flow_decorator is None:
             return None
 
         # Extract flow metadata from decorator
-        flow_name = class_node.name  # Default to class name
-        flow_description = ""
-
-        for decorator in class_node.decorator_list:
-            if self._is_flow_decorator(decorator):
-                args = self._extract_decorator_args(decorator)
-                flow_name = args.get("name", class_node.name)
-                flow_description = args.get("description", "")
-                break
+        args = self._extract_decorator_args(flow_decorator)
+        flow_name = args.get("name", class_node.name)  # Default to class name
+        flow_description = args.get("description", "")
 
         steps: list[StepData] = []
         edges: list[Edge] = []
 
-        # Find all @step decorated methods in this class
-        decorated_methods: dict[str, ast.FunctionDef] = {}
-        for node in class_node.body:
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if self._has_step_decorator(node):
-                    decorated_methods[node.name] = node
-
-        # Get all callable step names (for call detection)
-        callable_steps = set(all_steps.keys())
-
         # Parse each method to find calls to other steps
-        for method_name, method_node in decorated_methods.items():
+        for method_node in decorated_methods.values():
             step_data = self._extract_step_metadata(method_node)
 
             # Find calls to other @step decorated functions/methods
             connections = self._find_step_calls(method_node, callable_steps)
             step_data.calls = connections
 
-            # Create edges from this step to called steps
-            for call in connections:
-                edges.append(Edge(from_step=method_name, to_step=call.to_step, branch=call.branch))
+            # Flow edges carry no line numbers, so they are separate from the calls
+            edges.extend(Edge(c.from_step, c.to_step, c.branch) for c in connections)
 
             steps.append(step_data)
 
@@ -422,7 +561,7 @@ class FlowParser:
     def _extract_factory_flow(
         self,
         func_node: ast.FunctionDef | ast.AsyncFunctionDef,
-        all_steps: dict[str, ast.FunctionDef],
+        callable_steps: set[str],
     ) -> FlowData | None:
         """Extract flow metadata from a @flow decorated factory function.
 
@@ -430,40 +569,36 @@ class FlowParser:
         together form the flow. Common for FastAPI/Flask app-factory patterns.
 
         :param func_node: Function definition AST node with @flow decorator
-        :param all_steps: All available @step functions/methods (for call resolution)
+        :param callable_steps: Names of all @step functions/methods usable as call targets
         :return: FlowData or None if not a @flow factory
         """
-        if not self._has_flow_decorator(func_node):
+        flow_decorator = next(
+            (d for d in func_node.decorator_list if self._is_flow_decorator(d)), None
+        )
+        if flow_decorator is None:
             return None
 
-        flow_name = func_node.name
-        flow_description = ""
-        for decorator in func_node.decorator_list:
-            if self._is_flow_decorator(decorator):
-                args = self._extract_decorator_args(decorator)
-                flow_name = args.get("name", func_node.name)
-                flow_description = args.get("description", "")
-                break
+        args = self._extract_decorator_args(flow_decorator)
+        flow_name = args.get("name", func_node.name)
+        flow_description = args.get("description", "")
 
         # Collect @step decorated functions nested inside this factory
         nested_steps: dict[str, ast.FunctionDef | ast.AsyncFunctionDef] = {}
         for node in ast.walk(func_node):
             if node is func_node:
                 continue
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if type(node) in _FUNCTION_DEF_TYPES:
                 if self._has_step_decorator(node):
                     nested_steps[node.name] = node
 
         steps: list[StepData] = []
         edges: list[Edge] = []
-        callable_steps = set(all_steps.keys())
 
-        for step_name, step_node in nested_steps.items():
+        for step_node in nested_steps.values():
             step_data = self._extract_step_metadata(step_node)
             connections = self._find_step_calls(step_node, callable_steps)
             step_data.calls = connections
-            for call in connections:
-                edges.append(Edge(from_step=step_name, to_step=call.to_step, branch=call.branch))
+            edges.extend(Edge(c.from_step, c.to_step, c.branch) for c in connections)
             steps.append(step_data)
 
         return FlowData(
@@ -474,43 +609,22 @@ class FlowParser:
             description=flow_description,
         )
 
-    @staticmethod
-    def _extract_function_steps(
-        tree: ast.Module, all_steps: dict[str, ast.FunctionDef]
-    ) -> list[ast.FunctionDef]:
-        """Extract standalone @step decorated functions (not in classes).
-
-        :param tree: Module AST node
-        :param all_steps: All available @step functions/methods
-        :return: list of standalone function AST nodes
-        """
-        function_steps: list[ast.FunctionDef] = []
-
-        for node in tree.body:
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if node.name in all_steps:
-                    function_steps.append(node)
-
-        return function_steps
-
     def _create_function_flow(
         self,
         function_steps: list[ast.FunctionDef],
-        all_steps: dict[str, ast.FunctionDef],
+        callable_steps: set[str],
         tree: ast.Module,
     ) -> FlowData:
         """Create a flow from standalone @step functions.
 
         :param function_steps: List of function AST nodes
-        :param all_steps: All available @step functions/methods
+        :param callable_steps: Names of all @step functions/methods usable as call targets
         :param tree: Full module AST tree
         :return: FlowData object
         """
         steps: list[StepData] = []
         edges: list[Edge] = []
 
-        callable_steps = set(all_steps.keys())
-
         # Parse each function to find calls to other steps
         for func_node in function_steps:
             step_data = self._extract_step_metadata(func_node)
@@ -519,11 +633,8 @@ class FlowParser:
             connections = self._find_step_calls(func_node, callable_steps)
             step_data.calls = connections
 
-            # Create edges from this step to called steps
-            for call in connections:
-                edges.append(
-                    Edge(from_step=func_node.name, to_step=call.to_step, branch=call.branch)
-                )
+            # Flow edges carry no line numbers, so they are separate from the calls
+            edges.extend(Edge(c.from_step, c.to_step, c.branch) for c in connections)
 
             steps.append(step_data)
 
@@ -544,16 +655,13 @@ class FlowParser:
         :param func_node: Function definition AST node
         :return: StepData object
         """
-        step_name = func_node.name  # Default to function name
-        step_description = ""
-
         # Find @step decorator and extract arguments
-        for decorator in func_node.decorator_list:
-            if self._is_step_decorator(decorator):
-                args = self._extract_decorator_args(decorator)
-                step_name = args.get("name", func_node.name)
-                step_description = args.get("description", "")
-                break
+        step_decorator = next(
+            (d for d in func_node.decorator_list if self._is_step_decorator(d)), None
+        )
+        args = {} if step_decorator is None else self._extract_decorator_args(step_decorator)
+        step_name = args.get("name", func_node.name)  # Default to function name
+        step_description = args.get("description", "")
 
         docstring = ast.get_docstring(func_node)
 
@@ -570,9 +678,9 @@ class FlowParser:
 
         :param function_node: Function definition AST node
         :param decorated_steps: Set of names of decorated steps
-        :return: List of call dictionaries
+        :return: Calls found, as edges from this function with their line numbers
         """
-        visitor = FlowCallVisitor(decorated_steps)
+        visitor = FlowCallVisitor(decorated_steps, function_node.name)
         visitor.visit(function_node)
         return visitor.calls_to_steps
 
@@ -592,7 +700,7 @@ class FlowParser:
         :param exclude: Additional directory names to exclude
         :return: List of FlowData objects with cross-module references resolved
         """
-        from flowdoc.discovery import discover_python_files
+        from flowdoc.discovery import iter_python_files
 
         root = Path(root)
         if src_root:
@@ -601,33 +709,45 @@ class FlowParser:
             src_root_path = root.parent
         else:
             src_root_path = root
+        # Resolved once here rather than for every file in _path_to_module
+        src_root_path = src_root_path.resolve()
+
+        # Discover and parse files as the directory walk yields them, so parsing
+        # overlaps with listing the rest of the tree
+        markers = self._source_markers()
+        loaded: list[tuple[Path, _ParsedFile | SyntaxError]] = []
+        for file_path in iter_python_files(root, exclude):
+            try:
+                entry = _load_source_file(file_path, markers)
+            except SyntaxError as e:
+                loaded.append((file_path, e))
+                continue
+            if entry is not None:
+                loaded.append((file_path, entry))
 
-        # Discover files
-        files = discover_python_files(root, exclude)
+        # Registration order decides which step wins an ambiguous resolve, so
+        # results are processed in sorted path order, as discover_python_files returns
+        loaded.sort(key=lambda item: item[0])
 
         # First pass: collect all steps into registry
         registry = StepRegistry()
-        file_asts: dict[Path, ast.Module] = {}
+        file_asts: dict[Path, tuple[ast.Module, _ModuleSteps]] = {}
 
-        for file_path in files:
-            source = file_path.read_text(encoding="utf-8")
-            try:
-                tree = ast.parse(source, filename=str(file_path))
-            except SyntaxError as e:
-                warnings.warn(f"Cannot parse {file_path}: {e}", UserWarning, stacklevel=2)
+        for file_path, entry in loaded:
+            if isinstance(entry, SyntaxError):
+                warnings.warn(f"Cannot parse {file_path}: {entry}", UserWarning, stacklevel=2)
                 continue
-            file_asts[file_path] = tree
-
             module_path = self._path_to_module(file_path, src_root_path)
-            steps = self._collect_all_steps(tree)
-            for func_node in steps.values():
+            steps = self._cached_steps(entry)
+            file_asts[file_path] = (entry.tree, steps)
+            for func_node in steps.by_name.values():
                 step_data = self._extract_step_metadata(func_node)
                 registry.register(module_path, step_data)
 
         # Second pass: resolve cross-module references using per-file parsing
         flows: list[FlowData] = []
-        for _file_path, tree in file_asts.items():
-            file_flows = self._parse_tree_with_registry(tree, registry)
+        for tree, local_steps in file_asts.values():
+            file_flows = self._parse_tree_with_registry(tree, registry, local_steps)
             flows.extend(file_flows)
 
         return flows
@@ -637,11 +757,11 @@ class FlowParser:
         """Convert a file path to a dotted module path.
 
         :param file_path: Absolute path to Python file
-        :param src_root: Root directory for module resolution
+        :param src_root: Root directory for module resolution, already resolved
         :return: Dotted module path string
         """
         try:
-            relative = file_path.resolve().relative_to(src_root.resolve())
+            relative = file_path.resolve().relative_to(src_root)
         except ValueError:
             relative = file_path
 
@@ -657,6 +777,7 @@ class FlowParser:
         self,
         tree: ast.Module,
         registry: StepRegistry,
+        local_steps: _ModuleSteps | None = None,
     ) -> list[FlowData]:
         """Parse a single AST tree using a step registry for cross-module resolution.
 
@@ -664,38 +785,14 @@ class FlowParser:
 
         :param tree: AST Module node
         :param registry: StepRegistry with all known steps
+        :param local_steps: Steps already collected from this tree, if available
         :return: List of FlowData objects from this file
         """
-        flows: list[FlowData] = []
-
         # Collect steps from this file
-        local_steps = self._collect_all_steps(tree)
+        if local_steps is None:
+            local_steps = self._collect_all_steps(tree)
 
         # Use union of local and registry steps for call detection
-        combined_steps: dict[str, ast.FunctionDef | None] = dict(local_steps)
-        for s in registry.all_steps():
-            if s.function_name not in combined_steps:
-                combined_steps[s.function_name] = None
-
-        # Extract class-based flows
-        for node in tree.body:
-            if isinstance(node, ast.ClassDef):
-                flow_data = self._extract_class_flow(node, combined_steps, tree)
-                if flow_data:
-                    flows.append(flow_data)
+        callable_steps = registry.function_names().union(local_steps.by_name)
 
-        # Extract @flow decorated factory functions
-        for node in tree.body:
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                if self._has_flow_decorator(node):
-                    flow_data = self._extract_factory_flow(node, combined_steps)
-                    if flow_data:
-                        flows.append(flow_data)
-
-        # Extract function-based flow
-        function_steps = self._extract_function_steps(tree, local_steps)
-        if function_steps:
-            flow_data = self._create_function_flow(function_steps, combined_steps, tree)
-            flows.append(flow_data)
-
-        return flows
+        return self._extract_flows(tree, local_steps, callable_steps)
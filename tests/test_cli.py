@@ -130,11 +130,81 @@ class TestGenerateCommand:
         assert result.exit_code == 0
         assert "Generated:" in result.output
 
+    def test_generate_multiple_flows(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Each flow gets its own output and results are reported in flow order."""
+        src = tmp_path / "src"
+        src.mkdir()
+        for index, flow_name in enumerate(["Alpha Flow", "Beta Flow", "Gamma Flow"]):
+            (src / f"mod_{index}.py").write_text(
+                dedent(f"""
+                    from flowdoc import flow, step
+
+                    @flow(name="{flow_name}")
+                    class Flow{index}:
+                        @step(name="Start")
+                        def start(self):
+                            pass
+
+                    @step(name="Helper")
+                    def helper_{index}():
+                        pass
+                """)
+            )
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(cli, ["generate", str(src), "-f", "mermaid"])
+
+        assert result.exit_code == 0
+        lines = [line for line in result.output.splitlines() if line.startswith("Generated:")]
+        assert [Path(line.split(": ", 1)[1]).name for line in lines] == [
+            "alpha_flow.mmd",
+            "function_flow.mmd",
+            "beta_flow.mmd",
+            "function_flow.mmd",
+            "gamma_flow.mmd",
+            "function_flow.mmd",
+        ]
+        # Flows sharing an output path are written in order, so the last one wins
+        assert "helper_2" in (tmp_path / "function_flow.mmd").read_text()
+
+    def test_generate_unnamed_output_does_not_stop_batch(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A flow whose name slugifies to nothing is reported without blocking the others."""
+        source = tmp_path / "flows.py"
+        source.write_text(
+            dedent("""
+                from flowdoc import flow, step
+
+                @flow(name="???")
+                class Unnamed:
+                    @step(name="Start")
+                    def start(self):
+                        pass
+
+                @flow(name="Valid Flow")
+                class Valid:
+                    @step(name="Start")
+                    def start(self):
+                        pass
+            """)
+        )
+        monkeypatch.chdir(tmp_path)
+
+        result = runner.invoke(cli, ["generate", str(source), "-f", "mermaid"])
+
+        assert "Error generating diagram for '???'" in result.output
+        assert (tmp_path / "valid_flow.mmd").exists()
+
     def test_generate_syntax_error(self, runner: CliRunner, tmp_path: Path) -> None:
         """Test that syntax errors in source are reported gracefully."""
         bad_file = tmp_path / "bad.py"
-        bad_file.write_text("def broken(:\n    pass\n")
-        result = runner.invoke(cli, ["generate", str(bad_file), "-f", "dot"])
+        # The import keeps the file from being skipped before it is parsed
+        bad_file.write_text("from flowdoc import step\n\ndef broken(:\n    pass\n")
+        with pytest.warns(UserWarning, match="Cannot parse"):
+            result = runner.invoke(cli, ["generate", str(bad_file), "-f", "dot"])
         assert result.exit_code != 0
 
     def test_generate_empty_directory(self, runner: CliRunner, tmp_path: Path) -> None:
@@ -218,8 +288,10 @@ class TestValidateCommand:
     def test_validate_syntax_error(self, runner: CliRunner, tmp_path: Path) -> None:
         """Test that validate handles syntax errors gracefully."""
         bad_file = tmp_path / "bad.py"
-        bad_file.write_text("def broken(:\n    pass\n")
-        result = runner.invoke(cli, ["validate", str(bad_file)])
+        # The import keeps the file from being skipped before it is parsed
+        bad_file.write_text("from flowdoc import step\n\ndef broken(:\n    pass\n")
+        with pytest.warns(UserWarning, match="Cannot parse"):
+            result = runner.invoke(cli, ["validate", str(bad_file)])
         assert result.exit_code != 0
 
 
@@ -1,5 +1,7 @@
 """Tests for the @flow and @step decorators."""
 
+import inspect
+
 from flowdoc.decorators import (
     FlowMetadata,
     StepMetadata,
@@ -131,6 +133,17 @@ class TestStepDecorator:
 
         assert original_name.__name__ == "original_name"
 
+    def test_step_decorator_returns_original_function(self) -> None:
+        """Test that @step returns the function itself rather than a wrapper."""
+
+        async def fetch() -> None:
+            pass
+
+        decorated = step(name="Fetch")(fetch)
+
+        assert decorated is fetch
+        assert inspect.iscoroutinefunction(decorated)
+
     def test_step_decorator_on_method(self) -> None:
         """Test that @step decorator works on class methods."""
 
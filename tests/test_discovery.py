@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from flowdoc.discovery import discover_python_files, is_test_file
+from flowdoc.discovery import discover_python_files, is_test_file, iter_python_files
 
 
 class TestIsTestFile:
@@ -151,3 +151,41 @@ class TestDiscoverPythonFiles:
         result = discover_python_files(tmp_path)
         names = [p.name for p in result]
         assert names == sorted(names)
+
+    def test_nested_results_follow_path_order(self, tmp_path: Path) -> None:
+        """Files in subdirectories are ordered by path components."""
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a-b").mkdir()
+        (tmp_path / "a" / "x.py").write_text("x = 1\n")
+        (tmp_path / "a-b" / "y.py").write_text("x = 1\n")
+        (tmp_path / "b.py").write_text("x = 1\n")
+        result = discover_python_files(tmp_path)
+        relative = [p.relative_to(tmp_path.resolve()).as_posix() for p in result]
+        assert relative == ["a/x.py", "a-b/y.py", "b.py"]
+
+    def test_looping_symlinks_are_skipped(self, tmp_path: Path) -> None:
+        """Symlinks that point to themselves are neither walked nor returned."""
+        (tmp_path / "module.py").write_text("x = 1\n")
+        (tmp_path / "self_dir").symlink_to("self_dir")
+        (tmp_path / "self_file.py").symlink_to("self_file.py")
+        result = discover_python_files(tmp_path)
+        assert [p.name for p in result] == ["module.py"]
+
+
+class TestIterPythonFiles:
+    """Tests for iter_python_files()."""
+
+    def test_yields_same_files_as_discover(self, tmp_path: Path) -> None:
+        """The lazy walk finds the same files, before sorting."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "module.py").write_text("x = 1\n")
+        (tmp_path / "pkg" / "test_module.py").write_text("x = 1\n")
+        (tmp_path / "top.py").write_text("x = 1\n")
+        result = iter_python_files(tmp_path)
+        assert not isinstance(result, list)
+        assert sorted(result) == discover_python_files(tmp_path)
+
+    def test_invalid_root_raises_immediately(self) -> None:
+        """Root is validated when called, not on first iteration."""
+        with pytest.raises(FileNotFoundError, match="does not exist"):
+            iter_python_files(Path("/nonexistent/path"))
@@ -5,6 +5,7 @@ from pathlib import Path
 
 import pytest
 
+from flowdoc import generator as generator_module
 from flowdoc.generator import (
     DiagramGenerator,
     GraphvizGenerator,
@@ -224,6 +225,14 @@ class TestMermaidGenerator:
         content = output.read_text()
         assert "step_end" in content
 
+    def test_sanitize_id(self) -> None:
+        """Test that node IDs keep valid names and replace other characters."""
+        gen = MermaidGenerator()
+        assert gen._sanitize_id("validate_order") == "validate_order"
+        assert gen._sanitize_id("Order.validate") == "Order_validate"
+        assert gen._sanitize_id("End") == "step_End"
+        assert gen._sanitize_id("café") == "caf_"
+
     def test_special_characters_in_label(self, tmp_path: Path) -> None:
         """Test that special characters in step names are escaped."""
         flow_data = FlowData(
@@ -276,6 +285,66 @@ class TestCreateGeneratorFactory:
         with pytest.raises(ValueError, match="Unsupported format"):
             create_generator("bmp")
 
+    def test_missing_graphviz_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(generator_module, "_Digraph", None)
+        with pytest.raises(ImportError, match="pip install flowdoc\\[graphviz\\]"):
+            create_generator("png")
+
+    def test_missing_jinja2_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(generator_module, "_has_jinja2", lambda: False)
+        with pytest.raises(ImportError, match="pip install flowdoc\\[html\\]"):
+            create_generator("html")
+
+
+class TestGenerateMany:
+    """Tests for batch generation via generate_many()."""
+
+    def test_results_in_job_order(
+        self, tmp_path: Path, sample_flow_data: FlowData, linear_flow_data: FlowData
+    ) -> None:
+        gen = MermaidGenerator()
+        jobs = [(sample_flow_data, tmp_path / "first"), (linear_flow_data, tmp_path / "second")]
+        results = gen.generate_many(jobs)
+        assert results == [tmp_path / "first.mmd", tmp_path / "second.mmd"]
+        assert "Linear" not in results[0].read_text()
+        assert "step_a" in results[1].read_text()
+
+    def test_shared_output_path_last_flow_wins(
+        self, tmp_path: Path, sample_flow_data: FlowData, linear_flow_data: FlowData
+    ) -> None:
+        gen = GraphvizGenerator(output_format="dot")
+        jobs = [(sample_flow_data, tmp_path / "out"), (linear_flow_data, tmp_path / "out")]
+        results = gen.generate_many(jobs)
+        assert results == [tmp_path / "out.dot", tmp_path / "out.dot"]
+        assert "step_a" in (tmp_path / "out.dot").read_text()
+
+    def test_failure_returned_in_place(self, tmp_path: Path, sample_flow_data: FlowData) -> None:
+        gen = MermaidGenerator()
+        missing_dir = tmp_path / "missing" / "out"
+        results = gen.generate_many(
+            [(sample_flow_data, missing_dir), (sample_flow_data, tmp_path / "ok")]
+        )
+        assert isinstance(results[0], OSError)
+        assert results[1] == tmp_path / "ok.mmd"
+
+    def test_text_formats_run_serially(
+        self, tmp_path: Path, sample_flow_data: FlowData, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def no_pool(*args: object, **kwargs: object) -> None:
+            raise AssertionError("thread pool used for a text format")
+
+        monkeypatch.setattr(generator_module, "ThreadPoolExecutor", no_pool)
+        jobs = [(sample_flow_data, tmp_path / "a"), (sample_flow_data, tmp_path / "b")]
+        assert GraphvizGenerator(output_format="dot").generate_many(jobs) == [
+            tmp_path / "a.dot",
+            tmp_path / "b.dot",
+        ]
+
+    def test_explicit_workers(self, tmp_path: Path, sample_flow_data: FlowData) -> None:
+        jobs = [(sample_flow_data, tmp_path / name) for name in ("a", "b", "c")]
+        results = MermaidGenerator().generate_many(jobs, workers=2)
+        assert results == [tmp_path / "a.mmd", tmp_path / "b.mmd", tmp_path / "c.mmd"]
+
 
 class TestStepClassification:
     """Tests for step classification logic."""
@@ -298,6 +367,13 @@ class TestStepClassification:
         edges = [Edge(from_step="process", to_step="next")]
         assert DiagramGenerator._classify_step(step, edges) == "regular"
 
+    def test_classify_from_counts(self, sample_flow_data: FlowData) -> None:
+        out_counts = DiagramGenerator._count_outgoing(sample_flow_data.edges)
+        classify = DiagramGenerator._classify_from_counts
+        assert classify("start", out_counts) == "regular"
+        assert classify("validate", out_counts) == "decision"
+        assert classify("process", out_counts) == "terminal"
+
 
 class TestDocstringTooltips:
     """Tests for docstring tooltip support in generators."""
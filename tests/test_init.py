@@ -0,0 +1,35 @@
+"""Tests for the flowdoc package root."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _run_fresh(code: str) -> subprocess.CompletedProcess:
+    """Run code in a new interpreter so no flowdoc submodule is imported yet."""
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+
+class TestLazyImports:
+    """Test attribute access on the package root."""
+
+    def test_public_name_resolves(self) -> None:
+        """Test a public name is imported from its submodule on access."""
+        result = _run_fresh("import flowdoc; print(flowdoc.FlowParser.__module__)")
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "flowdoc.parser"
+
+    def test_submodule_resolves(self) -> None:
+        """Test submodules are reachable as attributes without importing them first."""
+        result = _run_fresh("import flowdoc; print(flowdoc.parser.FlowParser.__name__)")
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == "FlowParser"
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        """Test unknown names raise AttributeError rather than ModuleNotFoundError."""
+        import flowdoc
+
+        with pytest.raises(AttributeError, match="no_such_thing"):
+            flowdoc.no_such_thing  # noqa: B018
+        assert not hasattr(flowdoc, "__no_such_dunder__")
@@ -1,11 +1,18 @@
 """Tests for the FlowParser and AST analysis."""
 
+import ast
+import os
+import time
 from pathlib import Path
 from textwrap import dedent
+from typing import Any
 
+import pytest
+
+from flowdoc import parser as parser_module
 from flowdoc.decorators import clear_flow_registry
 from flowdoc.models import Edge, StepData
-from flowdoc.parser import FlowParser, StepRegistry
+from flowdoc.parser import FlowParser, StepRegistry, clear_parse_cache
 
 
 class TestClassBasedFlowParsing:
@@ -55,6 +62,9 @@ class TestClassBasedFlowParsing:
         assert Edge(from_step="step1", to_step="step2", branch=None, line_number=None) in edges
         assert Edge(from_step="step2", to_step="step3", branch=None, line_number=None) in edges
 
+        # Each step's calls name the calling step and keep the call's line number
+        assert flow.steps[0].calls == [Edge(from_step="step1", to_step="step2", line_number=8)]
+
     def test_parse_class_flow_with_branching(self, tmp_path: Path) -> None:
         """Test parsing a class flow with if/else branches."""
         source = dedent("""
@@ -619,6 +629,35 @@ class TestMixedFlows:
 
         assert len(function_flows[0].steps) == 2
 
+    def test_flow_order_is_class_factory_function(self, tmp_path: Path) -> None:
+        """Test that flows are ordered by kind, not by position in the module."""
+        source = dedent("""
+            from flowdoc import flow, step
+
+            @step(name="Standalone")
+            def standalone():
+                pass
+
+            @flow(name="Factory Flow")
+            def factory():
+                @step(name="Nested")
+                def nested():
+                    pass
+
+            @flow(name="Class Flow")
+            class ClassFlow:
+                @step(name="Method")
+                def method(self):
+                    pass
+        """)
+
+        test_file = tmp_path / "ordered_flow.py"
+        test_file.write_text(source)
+
+        flows = FlowParser().parse_file(test_file)
+
+        assert [f.name for f in flows] == ["Class Flow", "Factory Flow", "Function Flow"]
+
 
 class TestFactoryFunctionFlows:
     """Tests for @flow decorated factory functions with nested @step inner functions."""
@@ -901,6 +940,48 @@ class TestEdgeCases:
 
         assert len(flows) == 0
 
+    def test_source_encoding_declaration_is_honoured(self, tmp_path: Path) -> None:
+        """Test that files are decoded using their PEP 263 coding declaration."""
+        source = dedent("""\
+            # -*- coding: latin-1 -*-
+            from flowdoc import step
+
+            @step(name="Café")
+            def order_coffee():
+                pass
+        """)
+
+        test_file = tmp_path / "latin1_flow.py"
+        test_file.write_bytes(source.encode("latin-1"))
+
+        flows = FlowParser().parse_file(test_file)
+
+        assert [s.name for s in flows[0].steps] == ["Café"]
+
+    def test_step_nested_in_plain_function_is_not_collected(self, tmp_path: Path) -> None:
+        """Test that @step functions inside a non-@flow function body are not call targets."""
+        source = dedent("""
+            from flowdoc import step
+
+            @step(name="Process")
+            def process():
+                return hidden()
+
+            def helper():
+                @step(name="Hidden")
+                def hidden():
+                    pass
+        """)
+
+        test_file = tmp_path / "nested_plain.py"
+        test_file.write_text(source)
+
+        flows = FlowParser().parse_file(test_file)
+
+        assert len(flows) == 1
+        assert [s.function_name for s in flows[0].steps] == ["process"]
+        assert flows[0].edges == []
+
     def test_step_calls_non_decorated_function(self, tmp_path: Path) -> None:
         """Test that calls to non-decorated functions are ignored."""
         source = dedent("""
@@ -1065,12 +1146,34 @@ class TestStepRegistry:
         assert result is not None
         assert result.name == "Check Inventory"
 
+    def test_resolve_by_partial_qualified_name(self) -> None:
+        """A dotted call name matches steps whose qualified name ends with it."""
+        registry = StepRegistry()
+        billing = StepData(name="Bill", function_name="charge", description="")
+        orders = StepData(name="Order", function_name="charge", description="")
+        registry.register("shop.billing", billing)
+        registry.register("shop.orders", orders)
+
+        result = registry.resolve("shop.api", "orders.charge")
+        assert result is not None
+        assert result.name == "Order"
+        assert registry.resolve("shop.api", "payments.charge") is None
+
     def test_resolve_returns_none_for_unknown(self) -> None:
         """Unknown calls return None."""
         registry = StepRegistry()
         result = registry.resolve("some.module", "unknown_function")
         assert result is None
 
+    def test_function_names(self) -> None:
+        """function_names() returns each registered function name once."""
+        registry = StepRegistry()
+        registry.register("mod1", StepData(name="A", function_name="step_a", description=""))
+        registry.register("mod2", StepData(name="A2", function_name="step_a", description=""))
+        registry.register("mod2", StepData(name="B", function_name="step_b", description=""))
+
+        assert registry.function_names() == {"step_a", "step_b"}
+
     def test_all_steps(self) -> None:
         """all_steps() returns all registered steps."""
         registry = StepRegistry()
@@ -1196,6 +1299,156 @@ class TestParseDirectory:
         assert "helper_function" not in edge_targets
 
 
+class TestParseCache:
+    """Tests for reuse of parsed ASTs across parse calls."""
+
+    @pytest.fixture
+    def parse_calls(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        """Record the filename of every ast.parse call made by the parser."""
+        clear_parse_cache()
+        calls: list[str] = []
+        real_parse = ast.parse
+
+        def counting_parse(
+            source: str | bytes, filename: str = "<unknown>", *args: Any, **kwargs: Any
+        ) -> ast.Module:
+            # Extra arguments pass through for pytest, which parses via ast too
+            calls.append(filename)
+            return real_parse(source, filename, *args, **kwargs)
+
+        monkeypatch.setattr(parser_module.ast, "parse", counting_parse)
+        return calls
+
+    @staticmethod
+    def _write_flow(file_path: Path, flow_name: str) -> None:
+        file_path.write_text(
+            dedent(f"""
+                from flowdoc import flow, step
+
+                @flow(name="{flow_name}")
+                class Flow:
+                    @step(name="Start")
+                    def start(self):
+                        pass
+            """)
+        )
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path: Path, parse_calls: list[str]) -> None:
+        """A second parse of an unchanged file reuses the cached AST."""
+        file_path = tmp_path / "flow.py"
+        self._write_flow(file_path, "Cached Flow")
+
+        first = FlowParser().parse_directory(file_path)
+        second = FlowParser().parse_directory(file_path)
+
+        assert len(parse_calls) == 1
+        assert first == second
+
+    def test_modified_file_is_reparsed(self, tmp_path: Path, parse_calls: list[str]) -> None:
+        """Editing a file invalidates its cached AST."""
+        file_path = tmp_path / "flow.py"
+        self._write_flow(file_path, "Original")
+        FlowParser().parse_directory(file_path)
+
+        self._write_flow(file_path, "Renamed Flow")
+        flows = FlowParser().parse_directory(file_path)
+
+        assert len(parse_calls) == 2
+        assert flows[0].name == "Renamed Flow"
+
+    def test_rewrite_restoring_mtime_is_reparsed(
+        self, tmp_path: Path, parse_calls: list[str]
+    ) -> None:
+        """A same-size rewrite that keeps the old mtime (cp -p, rsync -a) is detected."""
+        file_path = tmp_path / "flow.py"
+        self._write_flow(file_path, "Flow A")
+        before = file_path.stat()
+        FlowParser().parse_file(file_path)
+
+        time.sleep(0.01)  # Let the change time move past the filesystem's granularity
+        self._write_flow(file_path, "Flow B")
+        os.utime(file_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+        flows = FlowParser().parse_file(file_path)
+
+        assert len(parse_calls) == 2
+        assert flows[0].name == "Flow B"
+
+    def test_relative_path_is_keyed_by_working_directory(
+        self, tmp_path: Path, parse_calls: list[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The same relative path in another working directory is a different file."""
+        first, second = tmp_path / "a", tmp_path / "b"
+        first.mkdir()
+        second.mkdir()
+        self._write_flow(first / "m.py", "Flow A")
+        self._write_flow(second / "m.py", "Flow B")
+        mtime_ns = (first / "m.py").stat().st_mtime_ns
+        os.utime(second / "m.py", ns=(mtime_ns, mtime_ns))
+
+        monkeypatch.chdir(first)
+        FlowParser().parse_file(Path("m.py"))
+        monkeypatch.chdir(second)
+        flows = FlowParser().parse_file(Path("m.py"))
+
+        assert len(parse_calls) == 2
+        assert flows[0].name == "Flow B"
+
+    def test_files_without_decorator_names_are_not_parsed(
+        self, tmp_path: Path, parse_calls: list[str]
+    ) -> None:
+        """parse_directory skips files that never mention a flow or step decorator."""
+        self._write_flow(tmp_path / "flow.py", "Flow")
+        (tmp_path / "helpers.py").write_text("def helper():\n    return 1\n")
+
+        flows = FlowParser().parse_directory(tmp_path)
+
+        assert [f.name for f in flows] == ["Flow"]
+        assert parse_calls == [str(tmp_path / "flow.py")]
+
+    def test_parse_file_parses_files_without_decorator_names(self, tmp_path: Path) -> None:
+        """parse_file does not skip the file it is given, so syntax errors still raise."""
+        file_path = tmp_path / "bad.py"
+        file_path.write_text("def broken(:\n    pass\n")
+
+        with pytest.raises(SyntaxError, match="Cannot parse"):
+            FlowParser().parse_file(file_path)
+
+    def test_least_recently_used_file_is_evicted(
+        self, tmp_path: Path, parse_calls: list[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The cache holds at most _PARSE_CACHE_SIZE files."""
+        monkeypatch.setattr(parser_module, "_PARSE_CACHE_SIZE", 1)
+        first, second = tmp_path / "first.py", tmp_path / "second.py"
+        self._write_flow(first, "First")
+        self._write_flow(second, "Second")
+
+        FlowParser().parse_file(first)
+        FlowParser().parse_file(second)
+        FlowParser().parse_file(first)
+
+        assert parse_calls == [str(first), str(second), str(first)]
+
+    def test_collected_steps_are_reused(
+        self, tmp_path: Path, parse_calls: list[str], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Step collection runs once per unchanged file."""
+        collect_calls: list[ast.Module] = []
+        real_collect = FlowParser._collect_all_steps
+
+        def counting_collect(self: FlowParser, tree: ast.Module) -> parser_module._ModuleSteps:
+            collect_calls.append(tree)
+            return real_collect(self, tree)
+
+        monkeypatch.setattr(FlowParser, "_collect_all_steps", counting_collect)
+        file_path = tmp_path / "flow.py"
+        self._write_flow(file_path, "Cached Flow")
+
+        FlowParser().parse_file(file_path)
+        FlowParser().parse_directory(file_path)
+
+        assert len(collect_calls) == 1
+
+
 class TestDocstringExtraction:
     """Tests for docstring extraction."""
 